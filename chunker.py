@@ -1,4 +1,5 @@
 import json
+import orjson
 import hashlib
 from pathlib import Path
 from collections import defaultdict
@@ -11,6 +12,7 @@ import tiktoken
 MAX_TOKENS     = 512   # max tokens per final chunk
 OVERLAP_TOKENS = 50    # overlap between split chunks to preserve context
 MIN_TOKENS     = 50    # merge blocks smaller than this with their neighbor
+TXT_BUFFER     = 1024 * 1024  # write buffer for the TXT dump (bytes)
 
 
 # ----------------------------------------------------------------------
@@ -216,6 +218,20 @@ def _build_chunk(text, content_type, token_count, chunk_index, meta,
     }
 
 
+# ----------------------------------------------------------------------
+# Format one chunk of the TXT dump as a single string
+# ----------------------------------------------------------------------
+def _txt_record(chunk: dict) -> str:
+    meta = "".join(f"{k}: {v}\n" for k, v in chunk.items() if k != "text")
+    return (
+        f"{'=' * 80}\n"
+        f"CHUNK {chunk['chunk_index']}  [{chunk['content_type'].upper()}]  "
+        f"tokens={chunk['token_count']}\n"
+        f"{'=' * 80}\n"
+        f"{meta}\nCONTENT:\n{chunk['text']}\n\n"
+    )
+
+
 # ----------------------------------------------------------------------
 # Save final chunks
 # ----------------------------------------------------------------------
@@ -224,24 +240,15 @@ def save_chunks(chunks: list[dict], output_dir: str = "output"):
 
     # JSONL — primary output for embedding / LLM pipeline
     jsonl_path = Path(output_dir) / "chunked.jsonl"
-    with open(jsonl_path, "w", encoding="utf-8") as f:
+    with open(jsonl_path, "wb") as f:
         for chunk in chunks:
-            f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+            f.write(orjson.dumps(chunk) + b"\n")
     print(f"\n✅ JSONL saved : {jsonl_path.resolve()}")
 
     # TXT — human readable
     txt_path = Path(output_dir) / "chunked.txt"
-    with open(txt_path, "w", encoding="utf-8") as f:
-        for chunk in chunks:
-            f.write("=" * 80 + "\n")
-            f.write(f"CHUNK {chunk['chunk_index']}  [{chunk['content_type'].upper()}]  "
-                    f"tokens={chunk['token_count']}\n")
-            f.write("=" * 80 + "\n")
-            for k, v in chunk.items():
-                if k != "text":
-                    f.write(f"{k}: {v}\n")
-            f.write("\nCONTENT:\n")
-            f.write(chunk["text"] + "\n\n")
+    with open(txt_path, "w", encoding="utf-8", buffering=TXT_BUFFER) as f:
+        f.writelines(_txt_record(chunk) for chunk in chunks)
     print(f"✅ TXT saved   : {txt_path.resolve()}")
 
     # Summary stats
@@ -0,0 +1,165 @@
+# ----------------------------------------------------------------------
+# HTTP fetch helpers shared by main.py and scraper.py
+# ----------------------------------------------------------------------
+import codecs
+import re
+import requests_cache
+from requests.adapters import HTTPAdapter
+
+
+# ----------------------------------------------------------------------
+# Fetch limits  –  pages are streamed and refused past MAX_PAGE_BYTES so
+# one pathological page cannot stall the crawl or exhaust memory
+# ----------------------------------------------------------------------
+MAX_PAGE_BYTES = 5_000_000
+STREAM_CHUNK_SIZE = 8192
+
+
+def declared_size_ok(response) -> bool:
+    """False if the Content-Length header already announces an oversized page."""
+    declared = response.headers.get("Content-Length", "")
+    return not declared.isdigit() or int(declared) <= MAX_PAGE_BYTES
+
+
+def cacheable(response) -> bool:
+    """True only if the Content-Length header announces a page within the limit."""
+    declared = response.headers.get("Content-Length", "")
+    return declared.isdigit() and int(declared) <= MAX_PAGE_BYTES
+
+
+def read_body(response) -> bytes:
+    """Read a streamed response body, enforcing MAX_PAGE_BYTES."""
+    if not declared_size_ok(response):
+        raise ValueError(
+            f"Content-Length {response.headers['Content-Length']} exceeds {MAX_PAGE_BYTES} bytes"
+        )
+
+    parts = []
+    size = 0
+    for part in response.iter_content(STREAM_CHUNK_SIZE):
+        size += len(part)
+        if size > MAX_PAGE_BYTES:
+            raise ValueError(f"body exceeds {MAX_PAGE_BYTES} bytes")
+        parts.append(part)
+    return b"".join(parts)
+
+
+# ----------------------------------------------------------------------
+# Page encoding  –  lxml ignores the HTTP header and falls back to
+# Latin-1 when a page has no <meta charset>, so the charset is resolved
+# from the response instead and the page handed to lxml as UTF-8
+# ----------------------------------------------------------------------
+CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+META_SCAN_BYTES = 4096      # <meta charset> belongs near the top of <head>
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _codec(label) -> str | None:
+    """Python codec name for a charset label, None if unknown."""
+    try:
+        return codecs.lookup(label.decode("ascii") if isinstance(label, bytes) else label).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+
+def page_encoding(response, content: bytes) -> str:
+    """Codec name for a page: BOM, header charset, <meta charset>, then UTF-8 or cp1252."""
+    for bom, encoding in BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    match = CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    if match and (encoding := _codec(match.group(1))):
+        return encoding
+
+    match = META_CHARSET_RE.search(content[:META_SCAN_BYTES])
+    if match and (encoding := _codec(match.group(1))):
+        return encoding
+
+    # No declaration: statistical guessing misreads short Latin pages, so
+    # take UTF-8 only if the bytes decode strictly, else cp1252 (what
+    # browsers use for undeclared Latin-1)
+    try:
+        content.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+def as_utf8(content: bytes, encoding: str) -> bytes:
+    """Re-encode a page to UTF-8; libxml2 does not know every Python codec name."""
+    if encoding == "utf-8":
+        return content
+    return content.decode(encoding, errors="replace").encode("utf-8")
+
+
+# ----------------------------------------------------------------------
+# HTTP session  –  one pooled session for the whole crawl. Keep-alive
+# avoids a new TCP/TLS handshake per page on the same host. Responses
+# with a declared size are cached on disk and revalidated with
+# ETag/Last-Modified; pages sent without a Content-Length are not (see
+# cacheable) and are revalidated from the extraction cache instead.
+# ----------------------------------------------------------------------
+def build_session(cache_name: str, cache_expire: int, pool_size: int,
+                  headers: dict) -> requests_cache.CachedSession:
+    session = requests_cache.CachedSession(
+        cache_name,
+        backend="sqlite",
+        cache_control=True,
+        expire_after=cache_expire,
+        # Storing a response reads its whole body before read_body can
+        # cap it, so only pages with a small declared length are cached;
+        # chunked responses of unknown size are streamed through the cap
+        filter_fn=cacheable,
+    )
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=max(20, pool_size))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# ----------------------------------------------------------------------
+# Extraction cache  –  what was extracted from a page is stored under its
+# URL together with the page's validators (ETag, Last-Modified). Re-runs
+# send those validators back, so an unchanged page answers 304 and its
+# records are reused without downloading the body, even when the HTTP
+# cache skipped it. The URL is the one requested, not response.url after
+# redirects, because records are stamped with the requested URL. The
+# caller adds whatever else its records depend on to the key.
+# ----------------------------------------------------------------------
+def page_cache_key(url: str, *scope: str) -> str:
+    return "::".join((*scope, url))
+
+
+def validators(response) -> tuple[str | None, str | None]:
+    """The (ETag, Last-Modified) pair a response can be revalidated with."""
+    return response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+
+def conditional_headers(known: tuple[str | None, str | None] | None) -> dict:
+    """If-None-Match / If-Modified-Since headers for a page seen on an earlier run."""
+    if not known:
+        return {}
+    etag, last_modified = known
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def not_modified(response, known: tuple[str | None, str | None] | None) -> bool:
+    """True if the page is unchanged since the run that stored `known`.
+
+    Either the server answered 304, or the HTTP cache served a response
+    carrying the same validators.
+    """
+    return bool(known) and (response.status_code == 304 or validators(response) == known)
@@ -1,32 +1,119 @@
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from datetime import datetime
 import hashlib
-import json
+import shelve
+import orjson
+import re
+import threading
 import time
+from io import BytesIO
 import urllib.robotparser
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlunparse
 from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+from fetching import (as_utf8, build_session, conditional_headers, not_modified,
+                      page_cache_key, page_encoding, read_body, validators)
+
+
+# ----------------------------------------------------------------------
+# Link filtering
+# ----------------------------------------------------------------------
+BLOCKED_EXT_RE = re.compile(r"\.(?:pdf|jpg|png|zip|xlsx)$", re.IGNORECASE)
+
+# The same menu/footer links appear on every page — parse each URL once
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+
+@lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
+    """Dedup key: lower-case scheme/host, no trailing slash, sorted query, no fragment."""
+    p = _parse_url(url)
+    query = "&".join(sorted(p.query.split("&"))) if p.query else ""
+    return urlunparse((p.scheme.lower(), p.netloc.lower(), p.path.rstrip("/") or "/", "", query, ""))
+
+
+# ----------------------------------------------------------------------
+# Page structure
+# ----------------------------------------------------------------------
+HEADING_TAGS = {"h1", "h2", "h3", "h4"}
+CONTENT_TAGS = HEADING_TAGS | {"p", "li", "dd", "table"}
+NOISE_TAGS = {"script", "style", "noscript", "iframe", "nav", "footer", "header"}
+
+# FIX #5 – prefer main/article/content div to avoid nav menus
+CONTENT_ROOTS = ("main", "article", "div#content", "div.content", "body", "document")
+
+# FIX #1 – meta tags that name the organisation, in priority order
+ORG_META = (("property", "og:site_name"), ("name", "author"), ("name", "organization"))
+
+
+# ----------------------------------------------------------------------
+# Chunk record  –  slotted dataclass instead of a per-chunk dict: no
+# per-instance hash table and no repeated key strings
+# ----------------------------------------------------------------------
+@dataclass(slots=True)
+class Chunk:
+    source_url: str
+    document_title: str
+    organization: str
+    document_type: str
+    section_title: str | None
+    section_level: str | None
+    chapter: str | None
+    article: str | None
+    content_type: str
+    text: str
+    char_count: int
+    chunk_id: str
+    extracted_at: str
+
+
+# ----------------------------------------------------------------------
+# Extraction cache
+# ----------------------------------------------------------------------
+# Bump whenever extraction output or the Chunk fields change, so pages
+# cached by an older version are re-extracted instead of reused
+CACHE_VERSION = 5
 
 
 class GovernanceContentExtractor:
-    def __init__(self, timeout=20, max_depth=2, document_type="governance_policy", delay=1.0):
+    def __init__(self, timeout=20, max_depth=2, document_type="governance_policy", delay=1.0,
+                 max_workers=16, cache_name="governance_cache", cache_expire=86400):
         """
         Args:
             timeout     : HTTP request timeout in seconds
             max_depth   : How deep to crawl from the start URL
             document_type: Type label attached to every chunk (e.g. 'governance_policy')
-            delay       : Seconds to wait between requests (politeness)
+            delay       : Minimum seconds between requests, across all workers
+            max_workers : Pages fetched in parallel per batch
+            cache_name  : Path prefix for the HTTP cache and extracted-chunk cache
+            cache_expire: Seconds a cached page is reused before revalidating
         """
         self.timeout = timeout
         self.max_depth = max_depth
         self.document_type = document_type          # FIX #2 – no longer hardcoded
         self.delay = delay                          # FIX #6 – rate limiting
+        self.next_request_at = 0.0                  # monotonic time of the next allowed request
+        self.slot_lock = threading.Lock()
+        self.max_workers = max_workers
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Governance-Ingestion/1.0)"
         }
+
+        # Pooled keep-alive session with an on-disk HTTP cache (see build_session)
+        self.session = build_session(cache_name, cache_expire, max_workers, self.headers)
+
+        # Chunks already extracted from unchanged pages (see fetching.py).
+        # document_type is part of the key because it is stamped on chunks,
+        # CACHE_VERSION because older extractors produced different chunks.
+        self.chunk_cache = shelve.open(f"{cache_name}_chunks")
+
         self.visited = set()
+        self.seen_texts: set[bytes] = set()         # digests of emitted chunk texts
         self.robot_parsers = {}                     # FIX #7 – robots.txt cache per domain
 
     # ------------------------------------------------------------------
@@ -34,7 +121,7 @@ class GovernanceContentExtractor:
     # ------------------------------------------------------------------
     def _can_fetch(self, url: str) -> bool:
         """Return True if robots.txt allows fetching this URL."""
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         domain = f"{parsed.scheme}://{parsed.netloc}"
 
         if domain not in self.robot_parsers:
@@ -49,85 +136,243 @@ class GovernanceContentExtractor:
 
         return self.robot_parsers[domain].can_fetch("*", url)
 
+    # ------------------------------------------------------------------
+    # Politeness: one shared schedule for all fetch threads, so `delay`
+    # spaces out every request rather than every batch. The lock only
+    # guards booking a slot; the wait itself happens outside it.
+    # ------------------------------------------------------------------
+    def _wait_for_slot(self):
+        with self.slot_lock:
+            now = time.monotonic()
+            start = max(now, self.next_request_at)
+            self.next_request_at = start + self.delay
+        time.sleep(start - now)
+
     # ------------------------------------------------------------------
     # Page fetcher
+    # Returns (content, encoding, validators), with content None when the
+    # page is unchanged since the run that stored `known` (see fetching.py)
     # ------------------------------------------------------------------
-    def fetch_page(self, url: str) -> BeautifulSoup | None:
+    def fetch_page(self, url: str, known=None) -> tuple[bytes | None, str | None, tuple] | None:
+        self._wait_for_slot()                       # FIX #6 – politeness delay
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            with self.session.get(url, timeout=self.timeout, stream=True,
+                                  headers=conditional_headers(known)) as response:
+                response.raise_for_status()
+                if not_modified(response, known):
+                    return None, None, known
+                content = read_body(response)
+            return content, page_encoding(response, content), validators(response)
         except Exception as e:
             print(f"⚠️  Skipping {url} ({e})")
             return None
 
+    # ------------------------------------------------------------------
+    # Release the HTTP session and flush the chunk cache
+    # ------------------------------------------------------------------
+    def close(self):
+        self.session.close()
+        self.chunk_cache.close()
+
+    # ------------------------------------------------------------------
+    # Link filter: stay on same domain, http(s) only (no mailto:, tel:,
+    # javascript:), skip binary files and fragments
+    # ------------------------------------------------------------------
+    def is_allowed_url(self, url: str, base_domain: str) -> bool:
+        parsed = _parse_url(url)
+        return (
+            parsed.scheme in {"http", "https"}
+            and parsed.netloc.lower() == base_domain
+            and "#" not in url
+            and not BLOCKED_EXT_RE.search(url)
+        )
+
+    # ------------------------------------------------------------------
+    # Cross-page dedup: boilerplate (footer copy, cookie banners, nav
+    # text) repeats on every page. chunk_id includes the URL, so the key
+    # is a digest of the text alone.
+    # ------------------------------------------------------------------
+    def _is_duplicate(self, text: str) -> bool:
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        if key in self.seen_texts:
+            return True
+        self.seen_texts.add(key)
+        return False
+
     # ------------------------------------------------------------------
     # Chunk ID  –  FIX #3: include URL so identical text on different
     # pages gets a unique ID
     # ------------------------------------------------------------------
     def generate_chunk_id(self, text: str, url: str) -> str:
+        # blake2b with an 8-byte digest gives the same 16 hex chars as the
+        # old truncated sha256, at a fraction of the cost on short texts
         unique = f"{url}::{text}"
-        return hashlib.sha256(unique.encode("utf-8")).hexdigest()[:16]
+        return hashlib.blake2b(unique.encode("utf-8"), digest_size=8).hexdigest()
 
     # ------------------------------------------------------------------
     # Organisation name  –  FIX #1: extract from page meta, not hardcoded
     # ------------------------------------------------------------------
-    def extract_organization(self, soup: BeautifulSoup, url: str) -> str:
-        for attr in [{"property": "og:site_name"}, {"name": "author"}, {"name": "organization"}]:
-            tag = soup.find("meta", attr)
-            if tag and tag.get("content"):
-                return tag["content"].strip()
+    def extract_organization(self, metas: dict, url: str) -> str:
+        for key in ORG_META:
+            if metas.get(key):
+                return metas[key].strip()
         return urlparse(url).netloc  # fallback: use domain name
 
+    # ------------------------------------------------------------------
+    # Element text, whitespace-joined like BeautifulSoup's
+    # get_text(" ", strip=True) but walked by lxml in C
+    # ------------------------------------------------------------------
+    def node_text(self, element) -> str:
+        return " ".join(t.strip() for t in element.itertext() if t.strip())
+
     # ------------------------------------------------------------------
     # Table extractor (unchanged logic, called inline now – FIX #9)
     # ------------------------------------------------------------------
     def extract_table_text(self, table) -> str:
         rows = []
-        for tr in table.find_all("tr"):
-            cells = [td.get_text(" ", strip=True) for td in tr.find_all(["th", "td"])]
+        for tr in table.iter("tr"):
+            cells = [self.node_text(td) for td in tr.iter("th", "td")]
             if cells:
                 rows.append(" | ".join(cells))
         return "\n".join(rows)
 
+    # ------------------------------------------------------------------
+    # Content roots an element opens (see CONTENT_ROOTS)
+    # ------------------------------------------------------------------
+    def _root_kinds(self, element) -> list[str]:
+        tag = element.tag
+        if tag in {"main", "article", "body"}:
+            return [tag]
+        kinds = []
+        if tag == "div":
+            if element.get("id") == "content":
+                kinds.append("div#content")
+            if "content" in (element.get("class") or "").split():
+                kinds.append("div.content")
+        return kinds
+
+    # ------------------------------------------------------------------
+    # Streaming parser
+    # Walks the page with iterparse instead of building the full DOM
+    # first. Each content element is reduced to a (tag, text) record
+    # as soon as it closes, then cleared along with its finished
+    # siblings, so peak memory tracks the largest element rather than
+    # the whole page. Records are kept per candidate content root and
+    # the best root is picked once the page has been read.
+    # ------------------------------------------------------------------
+    def _stream_page(self, content: bytes, encoding: str) -> tuple[list[tuple[str, str]], str, dict, list[str]]:
+        document_title = None
+        metas = {}
+        hrefs = []
+        roots = {"document": []}    # content root kind → records inside it
+        open_roots = []             # (kind, depth) of roots still open
+        content_stack = []          # start order of open content elements
+        pending = []                # records of the outermost open content element
+        noise_depth = 0
+        depth = 0
+        order = 0
+
+        source = BytesIO(as_utf8(content, encoding))
+        for event, el in etree.iterparse(source, events=("start", "end"), html=True, encoding="utf-8"):
+            tag = el.tag
+
+            if event == "start":
+                depth += 1
+                if tag in NOISE_TAGS:
+                    noise_depth += 1
+                if noise_depth:
+                    continue
+                for kind in self._root_kinds(el):
+                    if kind not in roots:           # first match wins, like find()
+                        roots[kind] = []
+                        open_roots.append((kind, depth))
+                if tag in CONTENT_TAGS:
+                    order += 1
+                    content_stack.append(order)
+                continue
+
+            # ---- end event -----------------------------------------------
+            if tag in NOISE_TAGS:
+                noise_depth -= 1
+                el.clear(keep_tail=True)            # drop noise, keep following text
+                depth -= 1
+                continue
+            if noise_depth:
+                depth -= 1
+                continue
+
+            if tag == "title" and document_title is None:
+                document_title = "".join(el.itertext()).strip()
+            elif tag == "meta":
+                for attr in ("property", "name"):
+                    key = (attr, el.get(attr))
+                    if key in ORG_META and key not in metas:
+                        metas[key] = el.get("content")
+            elif tag == "a" and el.get("href") is not None:
+                hrefs.append(el.get("href"))
+
+            if tag in CONTENT_TAGS:
+                text = self.extract_table_text(el) if tag == "table" else self.node_text(el)
+                kinds = ["document"] + [kind for kind, _ in open_roots]
+                pending.append((content_stack.pop(), tag, text, kinds))
+
+                # Nested content closes inside-out; restore document order
+                # (outer element first) before handing records on
+                if not content_stack:
+                    for _, rec_tag, rec_text, rec_kinds in sorted(pending, key=lambda r: r[0]):
+                        for kind in rec_kinds:
+                            roots[kind].append((rec_tag, rec_text))
+                    pending.clear()
+
+            while open_roots and open_roots[-1][1] == depth:
+                open_roots.pop()
+
+            # Free everything already consumed outside open content elements
+            if not content_stack:
+                el.clear(keep_tail=True)
+                parent = el.getparent()
+                while parent is not None and el.getprevious() is not None:
+                    del parent[0]
+
+            depth -= 1
+
+        kind = next(k for k in CONTENT_ROOTS if k in roots)
+        return roots[kind], document_title or "Unknown", metas, hrefs
+
     # ------------------------------------------------------------------
     # Main content extractor
+    # Returns the page's chunks and the hrefs found outside noise tags,
+    # or None if the page could not be parsed.
     # ------------------------------------------------------------------
-    def extract_page_content(self, soup: BeautifulSoup, url: str) -> list[dict]:
-        # Remove noise tags
-        for tag in soup(["script", "style", "noscript", "iframe", "nav", "footer", "header"]):
-            tag.decompose()
+    def extract_page_content(self, content: bytes, url: str,
+                             encoding: str = "utf-8") -> tuple[list[Chunk], list[str]] | None:
+        try:
+            records, document_title, metas, hrefs = self._stream_page(content, encoding)
+        except etree.LxmlError as e:
+            print(f"⚠️  Skipping {url} ({e})")
+            return None
 
-        document_title = soup.title.get_text(strip=True) if soup.title else "Unknown"
-        organization = self.extract_organization(soup, url)   # FIX #1
+        # Fields shared by every chunk on this page, built once
+        page_meta = {
+            "source_url": url,
+            "document_title": document_title,
+            "organization": self.extract_organization(metas, url),   # FIX #1
+            "document_type": self.document_type,                      # FIX #2
+        }
         extracted_at = datetime.utcnow().isoformat()
 
-        # FIX #5 – prefer main/article/section to avoid nav menus
-        content_root = (
-            soup.find("main")
-            or soup.find("article")
-            or soup.find("div", {"id": "content"})
-            or soup.find("div", {"class": "content"})
-            or soup.body
-            or soup
-        )
-
         chunks = []
         current_section = None
         current_section_level = None
         current_chapter = None
         current_article = None
 
-        allowed_tags = {"h1", "h2", "h3", "h4", "p", "li", "dd", "table"}
-
         # FIX #9 – process ALL elements (including tables) in document order
         # so section context is always correct when a table is encountered
-        for element in content_root.find_all(allowed_tags):
-            tag_name = element.name
+        for tag_name, text in records:
 
             # ---- Headings: update section context ----------------------
-            if tag_name in {"h1", "h2", "h3", "h4"}:
-                text = element.get_text(" ", strip=True)
+            if tag_name in HEADING_TAGS:
                 if not text or len(text) < 5:
                     continue
 
@@ -143,15 +388,12 @@ class GovernanceContentExtractor:
 
             # ---- Tables: extract inline --------------------------------
             elif tag_name == "table":
-                table_text = self.extract_table_text(element)
-                if not table_text or len(table_text) < 50:  # FIX #4
+                if not text or len(text) < 50:  # FIX #4
                     continue
                 chunks.append(self._build_chunk(
-                    text=table_text,
+                    text=text,
                     content_type="table",
-                    url=url,
-                    document_title=document_title,
-                    organization=organization,
+                    page_meta=page_meta,
                     extracted_at=extracted_at,
                     current_section=current_section,
                     current_section_level=current_section_level,
@@ -162,16 +404,13 @@ class GovernanceContentExtractor:
 
             # ---- Regular text elements ---------------------------------
             else:
-                text = element.get_text(" ", strip=True)
                 if not text or len(text) < 50:      # FIX #4 – raised threshold
                     continue
 
             chunks.append(self._build_chunk(
                 text=text,
                 content_type=tag_name,
-                url=url,
-                document_title=document_title,
-                organization=organization,
+                page_meta=page_meta,
                 extracted_at=extracted_at,
                 current_section=current_section,
                 current_section_level=current_section_level,
@@ -179,115 +418,147 @@ class GovernanceContentExtractor:
                 current_article=current_article,
             ))
 
-        return chunks
+        return chunks, hrefs
 
     # ------------------------------------------------------------------
-    # Helper: build a chunk dict
+    # Helper: build a Chunk
     # ------------------------------------------------------------------
-    def _build_chunk(self, text, content_type, url, document_title, organization,
-                     extracted_at, current_section, current_section_level,
-                     current_chapter, current_article) -> dict:
-        return {
-            "source_url": url,
-            "document_title": document_title,
-            "organization": organization,                # FIX #1
-            "document_type": self.document_type,         # FIX #2
-            "section_title": current_section,
-            "section_level": current_section_level,
-            "chapter": current_chapter,
-            "article": current_article,
-            "content_type": content_type,
-            "text": text,
-            "char_count": len(text),
-            "chunk_id": self.generate_chunk_id(text, url),  # FIX #3
-            "extracted_at": extracted_at,
-        }
+    def _build_chunk(self, text, content_type, page_meta, extracted_at,
+                     current_section, current_section_level,
+                     current_chapter, current_article) -> Chunk:
+        return Chunk(
+            **page_meta,
+            section_title=current_section,
+            section_level=current_section_level,
+            chapter=current_chapter,
+            article=current_article,
+            content_type=content_type,
+            text=text,
+            char_count=len(text),
+            chunk_id=self.generate_chunk_id(text, page_meta["source_url"]),  # FIX #3
+            extracted_at=extracted_at,
+        )
 
     # ------------------------------------------------------------------
     # BFS Crawler
+    # Each round pops up to max_workers URLs off the frontier and fetches
+    # them in parallel; extraction and link discovery stay on this thread
+    # so self.visited needs no locking. Chunks are yielded page by page
+    # so the caller can write them out instead of holding the whole crawl.
     # ------------------------------------------------------------------
-    def crawl(self, start_url: str) -> list[dict]:
-        base_domain = urlparse(start_url).netloc
+    def crawl(self, start_url: str) -> Iterator[Chunk]:
+        base_domain = urlparse(start_url).netloc.lower()
         queue = deque([(start_url, 0)])
-        all_chunks = []
 
-        while queue:
-            url, depth = queue.popleft()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while queue:
+                batch = []
+                while queue and len(batch) < self.max_workers:
+                    url, depth = queue.popleft()
+                    key = canonical_url(url)
 
-            if url in self.visited or depth > self.max_depth:
-                continue
-
-            # FIX #7 – respect robots.txt
-            if not self._can_fetch(url):
-                print(f"🚫 Blocked by robots.txt: {url}")
-                continue
+                    if key in self.visited or depth > self.max_depth:
+                        continue
 
-            self.visited.add(url)
-            print(f"🔍 Scraping (depth={depth}): {url}")
-
-            # FIX #6 – politeness delay
-            time.sleep(self.delay)
-
-            soup = self.fetch_page(url)
-            if not soup:
-                continue
+                    # FIX #7 – respect robots.txt
+                    if not self._can_fetch(url):
+                        print(f"🚫 Blocked by robots.txt: {url}")
+                        continue
 
-            page_chunks = self.extract_page_content(soup, url)
-            all_chunks.extend(page_chunks)
-            print(f"   → {len(page_chunks)} chunks extracted")
+                    self.visited.add(key)
+                    print(f"🔍 Scraping (depth={depth}): {url}")
+                    batch.append((url, depth))
 
-            if depth < self.max_depth:
-                for link in soup.find_all("a", href=True):
-                    next_url = urljoin(url, link["href"])
-                    parsed = urlparse(next_url)
-                    # Stay on same domain, skip binary files and fragments
-                    if (
-                        parsed.netloc == base_domain
-                        and not next_url.lower().endswith((".pdf", ".jpg", ".png", ".zip", ".xlsx"))
-                        and "#" not in next_url
-                        and next_url not in self.visited
-                    ):
-                        queue.append((next_url, depth + 1))
+                if not batch:
+                    continue
 
-        return all_chunks
+                # Cached entries are (validators, (chunks, hrefs)); the
+                # validators make the fetch conditional
+                cache_keys = [page_cache_key(url, f"v{CACHE_VERSION}", self.document_type)
+                              for url, _ in batch]
+                cached = [self.chunk_cache.get(key) for key in cache_keys]
+                pages = executor.map(self.fetch_page, [url for url, _ in batch],
+                                     [entry[0] if entry else None for entry in cached])
+
+                for (url, depth), cache_key, entry, page in zip(batch, cache_keys, cached, pages):
+                    if not page:
+                        continue
+
+                    content, encoding, page_validators = page
+                    if content is None:
+                        page_chunks, hrefs = entry[1]
+                    else:
+                        extracted = self.extract_page_content(content, url, encoding)
+                        if extracted is None:
+                            continue            # parse failure: retry on the next run
+                        page_chunks, hrefs = extracted
+                        if any(page_validators):
+                            self.chunk_cache[cache_key] = (page_validators, extracted)
+                    # Dedup here rather than in extract_page_content so the
+                    # cached per-page chunks stay independent of crawl order
+                    new_chunks = [c for c in page_chunks if not self._is_duplicate(c.text)]
+                    print(f"   → {len(new_chunks)} chunks extracted, "
+                          f"{len(page_chunks) - len(new_chunks)} duplicates skipped ({url})")
+                    yield from new_chunks
+
+                    if depth < self.max_depth:
+                        seen_on_page = set()
+                        for href in hrefs:
+                            next_url = urljoin(url, href)
+                            if not self.is_allowed_url(next_url, base_domain):
+                                continue
+                            key = canonical_url(next_url)
+                            if key in self.visited or key in seen_on_page:
+                                continue
+                            seen_on_page.add(key)
+                            queue.append((next_url, depth + 1))
 
 
 # ----------------------------------------------------------------------
 # Save outputs  –  FIX #10: save JSONL (easy to parse) + readable TXT
 # ----------------------------------------------------------------------
-def save_outputs(chunks: list[dict], output_dir: str = "output"):
+TXT_BUFFER_SIZE = 1024 * 1024   # one large buffer instead of many small writes
+
+
+def _txt_record(i: int, chunk: Chunk) -> str:
+    """One chunk of the TXT dump as a single string."""
+    meta = "".join(
+        f"{field.name}: {getattr(chunk, field.name)}\n"
+        for field in fields(chunk) if field.name != "text"
+    )
+    return f"{'=' * 80}\nCHUNK {i}\n{'=' * 80}\n{meta}\nCONTENT:\n{chunk.text}\n\n"
+
+
+def save_outputs(chunks: Iterable[Chunk], output_dir: str = "output"):
     Path(output_dir).mkdir(exist_ok=True)
 
-    # --- JSONL (primary output for chunking pipeline) -----------------
+    # JSONL (primary output for chunking pipeline) + human-readable TXT
+    # (for inspection) are written in a single pass, so chunks can be
+    # streamed straight from crawl() without being kept in memory
     jsonl_path = Path(output_dir) / "governance_extracted.jsonl"
-    with open(jsonl_path, "w", encoding="utf-8") as f:
-        for chunk in chunks:
-            f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
-    print(f"✅ JSONL saved  : {jsonl_path.resolve()}")
-
-    # --- Human-readable TXT (for inspection) -------------------------
     txt_path = Path(output_dir) / "governance_extracted.txt"
-    with open(txt_path, "w", encoding="utf-8") as f:
-        for i, chunk in enumerate(chunks, 1):
-            f.write("=" * 80 + "\n")
-            f.write(f"CHUNK {i}\n")
-            f.write("=" * 80 + "\n")
-            for k, v in chunk.items():
-                if k != "text":
-                    f.write(f"{k}: {v}\n")
-            f.write("\nCONTENT:\n")
-            f.write(chunk["text"] + "\n\n")
-    print(f"✅ TXT saved    : {txt_path.resolve()}")
 
-    # --- Summary stats ------------------------------------------------
-    urls = {c["source_url"] for c in chunks}
+    urls = set()
     types = {}
-    for c in chunks:
-        types[c["content_type"]] = types.get(c["content_type"], 0) + 1
+    total = 0
+
+    with open(jsonl_path, "wb") as jsonl_file, \
+         open(txt_path, "w", encoding="utf-8", buffering=TXT_BUFFER_SIZE) as txt_file:
+        for total, chunk in enumerate(chunks, 1):
+            # orjson encodes the dataclass directly to UTF-8 bytes
+            jsonl_file.write(orjson.dumps(chunk) + b"\n")
+            txt_file.write(_txt_record(total, chunk))
 
+            urls.add(chunk.source_url)
+            types[chunk.content_type] = types.get(chunk.content_type, 0) + 1
+
+    print(f"\n✅ JSONL saved  : {jsonl_path.resolve()}")
+    print(f"✅ TXT saved    : {txt_path.resolve()}")
+
+    # --- Summary stats ------------------------------------------------
     print(f"\n📊 Summary:")
     print(f"   Pages crawled : {len(urls)}")
-    print(f"   Total chunks  : {len(chunks)}")
+    print(f"   Total chunks  : {total}")
     print(f"   Content types : {types}")
 
 
@@ -306,10 +577,10 @@ def main():
     )
 
     print("\n🚀 Starting crawl...\n")
-    chunks = extractor.crawl(url)
-
-    print(f"\n✅ Total chunks extracted: {len(chunks)}")
-    save_outputs(chunks)
+    try:
+        save_outputs(extractor.crawl(url))
+    finally:
+        extractor.close()
 
 
 if __name__ == "__main__":
@@ -1,69 +1,104 @@
 import os
-import json
-from langchain_community.document_loaders import PyPDFLoader
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+import pypdfium2 as pdfium
+from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 
 
 # -----------------------------------
 # Load PDF with page-level metadata
+# (PDFium via pypdfium2 — same Document
+# shape PyPDFLoader returned, page is 0-based)
 # -----------------------------------
 def load_pdf(pdf_path: str):
-    loader = PyPDFLoader(pdf_path)
-    return loader.load()
+    pdf = pdfium.PdfDocument(pdf_path)
+    documents = []
+
+    try:
+        for page_number, page in enumerate(pdf):
+            textpage = page.get_textpage()
+            # PDFium ends lines with \r\n (the splitter separators expect
+            # \n) and reports hyphens as U+FFFE, which PyPDFLoader gave as "-"
+            text = textpage.get_text_range().replace("\r\n", "\n").replace("\ufffe", "-")
+            textpage.close()
+            page.close()
+
+            documents.append(Document(
+                page_content=text,
+                metadata={"source": pdf_path, "page": page_number}
+            ))
+    finally:
+        pdf.close()
+
+    return documents
 
 
 # -----------------------------------
 # Recursive Chunking
 # -----------------------------------
-def chunk_documents(documents, source_name):
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=500,
-        chunk_overlap=50,
-        separators=[
-            "\n\nArticle ",
-            "\n\nSection ",
-            "\n\n",
-            "\n",
-            ". ",
-            " ",
-            ""
-        ]
-    )
-
-    chunks = []
-    chunk_id = 0
-
-    for doc in documents:
-        page_text = doc.page_content.strip()
-        page_number = doc.metadata.get("page", -1)
-
-        if not page_text:
-            continue
-
-        split_chunks = splitter.split_text(page_text)
-
-        for chunk in split_chunks:
-            chunk_id += 1
-            chunks.append({
-                "text": chunk,
-                "metadata": {
-                    "source": source_name,
-                    "page": page_number,
-                    "chunk_id": chunk_id
-                }
-            })
-
-    return chunks
+SEPARATORS = [
+    "\n\nArticle ",
+    "\n\nSection ",
+    "\n\n",
+    "\n",
+    ". ",
+    " ",
+    ""
+]
+
+# Built once per process and reused for every page
+SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=500,
+    chunk_overlap=50,
+    separators=SEPARATORS
+)
+
+
+# Split one (page_text, page_number) pair.
+# Module-level so ProcessPoolExecutor can pickle it.
+def _split_page(page):
+    page_text, page_number = page
+    return [(chunk, page_number) for chunk in SPLITTER.split_text(page_text.strip())]
+
+
+def chunk_documents(documents, source_name, max_workers=1):
+    # Splitting costs ~50 µs a page, so a whole document is done serially
+    # in milliseconds, well under what starting worker processes costs
+    # (each one re-imports langchain and pypdfium2 under spawn/forkserver).
+    # Pass max_workers > 1 to split very large page sets across processes;
+    # either way map() keeps page order, chunk ids are assigned afterwards
+    pages = [(doc.page_content, doc.metadata.get("page", -1)) for doc in documents]
+
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_split_page, pages, chunksize=8)
+            split_pages = [item for page_chunks in results for item in page_chunks]
+    else:
+        split_pages = [item for page in pages for item in _split_page(page)]
+
+    return [
+        {
+            "text": chunk,
+            "metadata": {
+                "source": source_name,
+                "page": page_number,
+                "chunk_id": chunk_id
+            }
+        }
+        for chunk_id, (chunk, page_number) in enumerate(split_pages, 1)
+    ]
 
 
 # -----------------------------------
 # Save chunks to JSONL
 # -----------------------------------
 def save_chunks(chunks, output_file):
-    with open(output_file, "w", encoding="utf-8") as f:
+    # orjson writes UTF-8 bytes directly (non-ASCII kept as-is)
+    with open(output_file, "wb") as f:
         for chunk in chunks:
-            f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+            f.write(orjson.dumps(chunk) + b"\n")
 
 
 # -----------------------------------
@@ -1,40 +1,120 @@
-import requests
+import asyncio
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from datetime import datetime
 import hashlib
-import json
-import time
+import shelve
+import orjson
+import re
 import urllib.robotparser
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
-from collections import deque
+from urllib.parse import urljoin, urlparse, urlunparse
+from functools import lru_cache
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields
+
+from fetching import (as_utf8, build_session, conditional_headers, not_modified,
+                      page_cache_key, page_encoding, read_body, validators)
+
+
+# ----------------------------------------------------------------------
+# Link filtering
+# ----------------------------------------------------------------------
+BLOCKED_EXT_RE = re.compile(r"\.(?:pdf|jpg|png|zip|xlsx|docx)$", re.IGNORECASE)
+
+# The same menu/footer links appear on every page — parse each URL once
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+
+@lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
+    """Dedup key: lower-case scheme/host, no trailing slash, sorted query, no fragment."""
+    p = _parse_url(url)
+    query = "&".join(sorted(p.query.split("&"))) if p.query else ""
+    return urlunparse((p.scheme.lower(), p.netloc.lower(), p.path.rstrip("/") or "/", "", query, ""))
+
+
+# ----------------------------------------------------------------------
+# Extraction cache
+# ----------------------------------------------------------------------
+# Bump whenever extraction output or the Block fields change, so pages
+# cached by an older version are re-extracted instead of reused
+CACHE_VERSION = 5
+
+
+# ----------------------------------------------------------------------
+# Page metadata
+# ----------------------------------------------------------------------
+# Meta tags that name the organisation, in priority order
+ORG_META = (
+    ("property", "og:site_name"),
+    ("name", "author"),
+    ("name", "organization"),
+    ("name", "publisher"),
+)
+
+
+# ----------------------------------------------------------------------
+# Block record  –  slotted dataclass instead of a per-block dict: no
+# per-instance hash table and no repeated key strings
+# ----------------------------------------------------------------------
+@dataclass(slots=True)
+class Block:
+    source_url: str
+    document_title: str
+    organization: str
+    document_type: str
+    section_title: str | None
+    section_level: str | None
+    chapter: str | None
+    article: str | None
+    content_type: str
+    text: str
+    char_count: int
+    chunk_id: str
+    extracted_at: str
 
 
 class GovernanceContentExtractor:
-    def __init__(self, timeout=20, max_depth=2, document_type="governance_policy", delay=1.0):
+    def __init__(self, timeout=20, max_depth=2, document_type="governance_policy", delay=1.0,
+                 concurrency=10, cache_name="governance_cache", cache_expire=86400):
         """
         Args:
             timeout       : HTTP request timeout in seconds
             max_depth     : How deep to crawl from the start URL
             document_type : Label attached to every chunk
-            delay         : Seconds to wait between requests (politeness)
+            delay         : Minimum seconds between requests, across all fetches
+            concurrency   : Number of pages fetched in parallel
+            cache_name    : Path prefix for the HTTP cache and extracted-block cache
+            cache_expire  : Seconds a cached page is reused before revalidating
         """
         self.timeout = timeout
         self.max_depth = max_depth
         self.document_type = document_type
         self.delay = delay
+        self.concurrency = concurrency
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Governance-Ingestion/1.0)"
         }
+
+        # Pooled keep-alive session with an on-disk HTTP cache (see build_session)
+        self.session = build_session(cache_name, cache_expire, concurrency, self.headers)
+
+        # Blocks already extracted from unchanged pages (see fetching.py),
+        # keyed by CACHE_VERSION and document_type as well since both change
+        # the blocks. Only touched from the event loop thread.
+        self.block_cache = shelve.open(f"{cache_name}_blocks")
+
         self.visited = set()
+        self.seen_texts: set[bytes] = set()     # digests of kept block texts
+        self.next_request_at = 0.0              # event loop time of the next allowed request
         self.robot_parsers = {}
 
     # ------------------------------------------------------------------
     # robots.txt
     # ------------------------------------------------------------------
     def _can_fetch(self, url: str) -> bool:
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         domain = f"{parsed.scheme}://{parsed.netloc}"
 
         if domain not in self.robot_parsers:
@@ -49,42 +129,87 @@ class GovernanceContentExtractor:
         return self.robot_parsers[domain].can_fetch("*", url)
 
     # ------------------------------------------------------------------
-    # Fetch raw HTML
+    # Fetch raw HTML — (html, encoding, validators), html None when the
+    # page is unchanged since the run that stored `known`
     # ------------------------------------------------------------------
-    def fetch_html(self, url: str) -> str | None:
+    def fetch_html(self, url: str, known=None) -> tuple[bytes | None, str | None, tuple] | None:
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            return response.text
+            with self.session.get(url, timeout=self.timeout, stream=True,
+                                  headers=conditional_headers(known)) as response:
+                response.raise_for_status()
+                if not_modified(response, known):
+                    return None, None, known
+                # Raw bytes plus their charset — bare lxml would ignore the
+                # Content-Type header, so the encoding travels with the page
+                html = read_body(response)
+            return html, page_encoding(response, html), validators(response)
         except Exception as e:
             print(f"  ⚠️  Skipping {url} ({e})")
             return None
 
+    # ------------------------------------------------------------------
+    # Release the HTTP session and flush the block cache
+    # ------------------------------------------------------------------
+    def close(self):
+        self.session.close()
+        self.block_cache.close()
+
+    # ------------------------------------------------------------------
+    # Cross-page dedup: boilerplate (footer copy, cookie banners, nav
+    # text) repeats on every page. chunk_id includes the URL, so the key
+    # is a digest of the text alone.
+    # ------------------------------------------------------------------
+    def _is_duplicate(self, text: str) -> bool:
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        if key in self.seen_texts:
+            return True
+        self.seen_texts.add(key)
+        return False
+
     # ------------------------------------------------------------------
     # Chunk ID — url + text combined for uniqueness
     # ------------------------------------------------------------------
     def generate_chunk_id(self, text: str, url: str) -> str:
+        # blake2b with an 8-byte digest gives the same 16 hex chars as the
+        # old truncated sha256, at a fraction of the cost on short texts
         unique = f"{url}::{text}"
-        return hashlib.sha256(unique.encode("utf-8")).hexdigest()[:16]
+        return hashlib.blake2b(unique.encode("utf-8"), digest_size=8).hexdigest()
 
     # ------------------------------------------------------------------
     # Organisation — extracted from page meta tags
+    # One pass over the <meta> tags instead of a full-document find()
+    # per candidate attribute
     # ------------------------------------------------------------------
-    def extract_organization(self, soup: BeautifulSoup, url: str) -> str:
-        for attr in [
-            {"property": "og:site_name"},
-            {"name": "author"},
-            {"name": "organization"},
-            {"name": "publisher"},
-        ]:
-            tag = soup.find("meta", attr)
-            if tag and tag.get("content"):
-                return tag["content"].strip()
+    def extract_organization(self, root: lxml_html.HtmlElement, url: str) -> str:
+        metas = {}
+        for tag in root.iter("meta"):
+            for attr in ("property", "name"):
+                key = (attr, tag.get(attr))
+                if key in ORG_META and key not in metas:
+                    metas[key] = tag.get("content")
+
+        for key in ORG_META:
+            if metas.get(key):
+                return metas[key].strip()
         return urlparse(url).netloc
 
+    # ------------------------------------------------------------------
+    # Parse a page with its resolved encoding (see page_encoding)
+    # ------------------------------------------------------------------
+    def parse_html(self, html: bytes, encoding: str) -> lxml_html.HtmlElement:
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+        return lxml_html.document_fromstring(as_utf8(html, encoding), parser=parser)
+
+    # ------------------------------------------------------------------
+    # Element text, same as BeautifulSoup's get_text(" ", strip=True)
+    # but walked by lxml in C
+    # ------------------------------------------------------------------
+    def node_text(self, element) -> str:
+        return " ".join(t.strip() for t in element.itertext() if t.strip())
+
     # ------------------------------------------------------------------
     # STEP 1 — trafilatura: get clean text as a whitelist
-    # Only text that trafilatura approves passes through BS4 extraction.
+    # Only text that trafilatura approves passes through lxml extraction.
     # This removes nav/sidebar/footer noise from ANY website.
     # ------------------------------------------------------------------
     def get_clean_text_set(self, html: str) -> set[str]:
@@ -106,22 +231,37 @@ class GovernanceContentExtractor:
         return lines
 
     # ------------------------------------------------------------------
-    # STEP 2 — BeautifulSoup: walk DOM in order
+    # STEP 2 — lxml: walk DOM in order
     # Preserves real heading levels (h1-h4), paragraphs, tables.
     # Filters elements against trafilatura whitelist.
+    # Returns the page's blocks and every href on it (for the BFS).
     # ------------------------------------------------------------------
-    def extract_page(self, html: str, url: str) -> list[dict]:
-        soup = BeautifulSoup(html, "html.parser")
+    def extract_page(self, html: bytes, url: str,
+                     encoding: str = "utf-8") -> tuple[list[Block], list[str]]:
+        root = self.parse_html(html, encoding)
+        hrefs = root.xpath("//a/@href")     # before noise tags are emptied
         extracted_at = datetime.utcnow().isoformat()
-        document_title = soup.title.get_text(strip=True) if soup.title else "Unknown"
-        organization = self.extract_organization(soup, url)
+        title = root.find(".//title")
+
+        # Fields shared by every block on this page, built once
+        page_meta = {
+            "source_url": url,
+            "document_title": (
+                "".join(t.strip() for t in title.itertext()) if title is not None else "Unknown"
+            ),
+            "organization": self.extract_organization(root, url),
+            "document_type": self.document_type,
+        }
 
-        # Get trafilatura whitelist for this page
-        clean_set = self.get_clean_text_set(html)
+        # Get trafilatura whitelist for this page, decoded the same way as
+        # the DOM so its lines compare equal to the element texts
+        clean_set = self.get_clean_text_set(html.decode(encoding, errors="replace"))
 
-        # Remove noise tags before walking DOM
-        for tag in soup(["script", "style", "noscript", "iframe", "nav", "footer", "header"]):
-            tag.decompose()
+        # Empty noise tags before walking DOM. clear(keep_tail=True) leaves
+        # the following text as its own string, as decompose() did, so
+        # "a <script/> b" still joins to "a b"
+        for tag in list(root.iter("script", "style", "noscript", "iframe", "nav", "footer", "header")):
+            tag.clear(keep_tail=True)
 
         blocks = []
         current_section = None
@@ -132,12 +272,12 @@ class GovernanceContentExtractor:
         HEADING_TAGS = {"h1", "h2", "h3", "h4"}
         CONTENT_TAGS = {"h1", "h2", "h3", "h4", "p", "li", "dd", "table"}
 
-        for element in soup.find_all(CONTENT_TAGS):
-            tag = element.name
+        for element in root.iter(*CONTENT_TAGS):
+            tag = element.tag
 
             # ── HEADINGS ───────────────────────────────────────────────
             if tag in HEADING_TAGS:
-                text = element.get_text(" ", strip=True)
+                text = self.node_text(element)
                 if not text or len(text) < 5:
                     continue
 
@@ -155,9 +295,7 @@ class GovernanceContentExtractor:
                 blocks.append(self._build_block(
                     text=text,
                     content_type="heading",
-                    url=url,
-                    document_title=document_title,
-                    organization=organization,
+                    page_meta=page_meta,
                     extracted_at=extracted_at,
                     section=current_section,
                     section_level=current_section_level,
@@ -174,9 +312,7 @@ class GovernanceContentExtractor:
                 blocks.append(self._build_block(
                     text=table_text,
                     content_type="table",
-                    url=url,
-                    document_title=document_title,
-                    organization=organization,
+                    page_meta=page_meta,
                     extracted_at=extracted_at,
                     section=current_section,
                     section_level=current_section_level,
@@ -186,7 +322,7 @@ class GovernanceContentExtractor:
 
             # ── PARAGRAPHS / LIST ITEMS ────────────────────────────────
             else:
-                text = element.get_text(" ", strip=True)
+                text = self.node_text(element)
                 if not text or len(text) < 30:
                     continue
 
@@ -206,11 +342,10 @@ class GovernanceContentExtractor:
 
                 # Extra check: skip li items that are purely navigation links
                 if tag == "li":
-                    anchors = element.find_all("a")
                     non_link_text = text
-                    for a in anchors:
+                    for a in element.iter("a"):
                         non_link_text = non_link_text.replace(
-                            a.get_text(" ", strip=True), ""
+                            self.node_text(a), ""
                         ).strip()
                     if len(non_link_text) < 20:
                         continue
@@ -218,9 +353,7 @@ class GovernanceContentExtractor:
                 blocks.append(self._build_block(
                     text=text,
                     content_type="paragraph" if tag in {"p", "dd"} else "list_item",
-                    url=url,
-                    document_title=document_title,
-                    organization=organization,
+                    page_meta=page_meta,
                     extracted_at=extracted_at,
                     section=current_section,
                     section_level=current_section_level,
@@ -228,151 +361,228 @@ class GovernanceContentExtractor:
                     article=current_article,
                 ))
 
-        return blocks
+        return blocks, hrefs
 
     # ------------------------------------------------------------------
-    # Build a block dict
+    # Build a Block
     # ------------------------------------------------------------------
-    def _build_block(self, text, content_type, url, document_title, organization,
-                     extracted_at, section, section_level, chapter, article) -> dict:
-        return {
-            "source_url": url,
-            "document_title": document_title,
-            "organization": organization,
-            "document_type": self.document_type,
-            "section_title": section,
-            "section_level": section_level,
-            "chapter": chapter,
-            "article": article,
-            "content_type": content_type,
-            "text": text,
-            "char_count": len(text),
-            "chunk_id": self.generate_chunk_id(text, url),
-            "extracted_at": extracted_at,
-        }
+    def _build_block(self, text, content_type, page_meta, extracted_at,
+                     section, section_level, chapter, article) -> Block:
+        return Block(
+            **page_meta,
+            section_title=section,
+            section_level=section_level,
+            chapter=chapter,
+            article=article,
+            content_type=content_type,
+            text=text,
+            char_count=len(text),
+            chunk_id=self.generate_chunk_id(text, page_meta["source_url"]),
+            extracted_at=extracted_at,
+        )
 
     # ------------------------------------------------------------------
     # Parse HTML table → pipe-delimited text
     # ------------------------------------------------------------------
     def _parse_table(self, table) -> str:
         rows = []
-        for tr in table.find_all("tr"):
-            cells = [td.get_text(" ", strip=True) for td in tr.find_all(["th", "td"])]
+        for tr in table.iter("tr"):
+            cells = [self.node_text(td) for td in tr.iter("th", "td")]
             if any(cells):
                 rows.append(" | ".join(cells))
         return "\n".join(rows)
 
     # ------------------------------------------------------------------
-    # Extract internal links for BFS
+    # Link filter: same domain, http(s) only, no binaries or fragments
+    # ------------------------------------------------------------------
+    def is_allowed_url(self, url: str, base_domain: str) -> bool:
+        parsed = _parse_url(url)
+        return (
+            parsed.netloc.lower() == base_domain
+            and parsed.scheme in {"http", "https"}
+            and "#" not in url
+            and not BLOCKED_EXT_RE.search(url)
+        )
+
+    # ------------------------------------------------------------------
+    # Internal links for BFS, from the hrefs extract_page collected
     # ------------------------------------------------------------------
-    def extract_internal_links(self, html: str, base_url: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        base_domain = urlparse(base_url).netloc
+    def extract_internal_links(self, hrefs: list[str], base_url: str) -> list[str]:
+        base_domain = urlparse(base_url).netloc.lower()
         links = []
+        seen_on_page = set()
+
+        for href in hrefs:
+            full_url = urljoin(base_url, href)
+            if not self.is_allowed_url(full_url, base_domain):
+                continue
 
-        for a in soup.find_all("a", href=True):
-            full_url = urljoin(base_url, a["href"])
-            parsed = urlparse(full_url)
+            key = canonical_url(full_url)
+            if key in self.visited or key in seen_on_page:
+                continue
+            seen_on_page.add(key)
+            links.append(full_url)
 
-            if (
-                parsed.netloc == base_domain
-                and parsed.scheme in {"http", "https"}
-                and not full_url.lower().endswith(
-                    (".pdf", ".jpg", ".png", ".zip", ".xlsx", ".docx")
-                )
-                and "#" not in full_url
-                and full_url not in self.visited
-            ):
-                links.append(full_url)
+        return links
 
-        return list(set(links))
+    # ------------------------------------------------------------------
+    # Politeness: one shared schedule for all fetches, so `delay` spaces
+    # out every request rather than each fetch's own. Runs on the event
+    # loop with no await between reading and booking a slot, so no lock.
+    # ------------------------------------------------------------------
+    async def _wait_for_slot(self):
+        now = asyncio.get_running_loop().time()
+        start = max(now, self.next_request_at)
+        self.next_request_at = start + self.delay
+        await asyncio.sleep(start - now)
 
     # ------------------------------------------------------------------
     # BFS Crawler
+    # The crawl advances one depth level at a time. Pages of a level are
+    # fetched concurrently (up to `concurrency` in flight; blocking HTTP
+    # and parsing run in threads), but URLs are claimed and results are
+    # handled in queue order, so the output, the cross-page dedup and
+    # the depth each URL is reached at match a plain sequential BFS.
+    # Blocks are yielded as soon as their page and every page queued
+    # before it are done, so the caller can write them out while later
+    # pages are still in flight instead of holding the whole crawl.
     # ------------------------------------------------------------------
-    def crawl(self, start_url: str) -> list[dict]:
-        queue = deque([(start_url, 0)])
-        all_blocks = []
-
-        while queue:
-            url, depth = queue.popleft()
-
-            if url in self.visited or depth > self.max_depth:
-                continue
-
-            if not self._can_fetch(url):
+    async def _fetch_url(self, url: str, depth: int,
+                         in_flight: asyncio.Semaphore) -> tuple[list[Block], list[str]] | None:
+        async with in_flight:
+            if not await asyncio.to_thread(self._can_fetch, url):
                 print(f"  🚫 Blocked by robots.txt: {url}")
-                continue
+                return None
 
-            self.visited.add(url)
             print(f"🔍 Scraping (depth={depth}): {url}")
 
-            time.sleep(self.delay)
+            await self._wait_for_slot()
 
-            html = self.fetch_html(url)
-            if not html:
-                continue
+            # Cached entries are (validators, (blocks, hrefs)); the
+            # validators make the fetch conditional
+            cache_key = page_cache_key(url, f"v{CACHE_VERSION}", self.document_type)
+            entry = self.block_cache.get(cache_key)
+            page = await asyncio.to_thread(self.fetch_html, url, entry[0] if entry else None)
+            if not page:
+                return None
 
-            blocks = self.extract_page(html, url)
-            all_blocks.extend(blocks)
+            html, encoding, page_validators = page
+            if html is None:
+                return entry[1]
+            if not html:
+                return None
+            extracted = await asyncio.to_thread(self.extract_page, html, url, encoding)
+            if any(page_validators):
+                self.block_cache[cache_key] = (page_validators, extracted)
+            return extracted
+
+    @staticmethod
+    async def _result(task: asyncio.Task):
+        # Runner.run() takes a coroutine, not a task
+        return await task
+
+    def crawl(self, start_url: str) -> Iterator[Block]:
+        in_flight = asyncio.Semaphore(self.concurrency)
+        level = [start_url]
+
+        # One event loop for the whole crawl; it only runs while waiting
+        # for the next page in order, the fetch threads keep going between
+        with asyncio.Runner() as runner:
+            loop = runner.get_loop()
+            for depth in range(self.max_depth + 1):
+                # Claim this level's URLs up front, in queue order
+                batch = []
+                for url in level:
+                    key = canonical_url(url)
+                    if key not in self.visited:
+                        self.visited.add(key)
+                        batch.append(url)
+
+                tasks = [loop.create_task(self._fetch_url(url, depth, in_flight)) for url in batch]
+
+                level = []
+                for url, task in zip(batch, tasks):
+                    try:
+                        result = runner.run(self._result(task))
+                    except Exception as e:
+                        print(f"  ⚠️  Failed {url} ({e})")
+                        continue
+                    if result is None:
+                        continue
+                    blocks, hrefs = result
 
-            # Per-type count for logging
-            counts = {}
-            for b in blocks:
-                counts[b["content_type"]] = counts.get(b["content_type"], 0) + 1
-            print(f"   → {len(blocks)} blocks {counts}")
+                    # Dedup after the cache so cached per-page blocks stay
+                    # independent of crawl order
+                    new_blocks = [b for b in blocks if not self._is_duplicate(b.text)]
 
-            if depth < self.max_depth:
-                links = self.extract_internal_links(html, url)
-                for link in links:
-                    queue.append((link, depth + 1))
+                    # Per-type count for logging
+                    counts = {}
+                    for b in new_blocks:
+                        counts[b.content_type] = counts.get(b.content_type, 0) + 1
+                    print(f"   → {len(new_blocks)} blocks {counts}, "
+                          f"{len(blocks) - len(new_blocks)} duplicates skipped  ({url})")
+                    yield from new_blocks
 
-        return all_blocks
+                    if depth < self.max_depth:
+                        level.extend(self.extract_internal_links(hrefs, url))
 
 
 # ----------------------------------------------------------------------
 # Save outputs
 # ----------------------------------------------------------------------
-def save_outputs(blocks: list[dict], output_dir: str = "output"):
+TXT_BUFFER_SIZE = 1024 * 1024   # one large buffer instead of many small writes
+
+
+def _txt_record(i: int, block: Block) -> str:
+    """One block of the TXT dump as a single string."""
+    meta = "".join(
+        f"{field.name}: {getattr(block, field.name)}\n"
+        for field in fields(block) if field.name != "text"
+    )
+    return (
+        f"{'=' * 80}\nBLOCK {i}  [{block.content_type.upper()}]\n{'=' * 80}\n"
+        f"{meta}\nCONTENT:\n{block.text}\n\n"
+    )
+
+
+def save_outputs(blocks: Iterable[Block], output_dir: str = "output"):
     Path(output_dir).mkdir(exist_ok=True)
 
-    # JSONL — primary output for chunker.py
+    # JSONL (primary output for chunker.py) + human-readable TXT are
+    # written in a single pass, so blocks can be streamed straight from
+    # crawl() without being kept in memory
     jsonl_path = Path(output_dir) / "scraped.jsonl"
-    with open(jsonl_path, "w", encoding="utf-8") as f:
-        for block in blocks:
-            f.write(json.dumps(block, ensure_ascii=False) + "\n")
-    print(f"\n✅ JSONL saved : {jsonl_path.resolve()}")
-
-    # TXT — human readable inspection
     txt_path = Path(output_dir) / "scraped.txt"
-    with open(txt_path, "w", encoding="utf-8") as f:
-        for i, block in enumerate(blocks, 1):
-            f.write("=" * 80 + "\n")
-            f.write(f"BLOCK {i}  [{block['content_type'].upper()}]\n")
-            f.write("=" * 80 + "\n")
-            for k, v in block.items():
-                if k != "text":
-                    f.write(f"{k}: {v}\n")
-            f.write("\nCONTENT:\n")
-            f.write(block["text"] + "\n\n")
-    print(f"✅ TXT saved   : {txt_path.resolve()}")
 
-    # Summary stats
-    urls = {b["source_url"] for b in blocks}
+    urls = set()
     type_counts = {}
-    for b in blocks:
-        type_counts[b["content_type"]] = type_counts.get(b["content_type"], 0) + 1
+    null_sections = 0
+    total = 0
 
-    null_sections = sum(1 for b in blocks if b["section_title"] is None)
+    with open(jsonl_path, "wb") as jsonl_file, \
+         open(txt_path, "w", encoding="utf-8", buffering=TXT_BUFFER_SIZE) as txt_file:
+        for total, block in enumerate(blocks, 1):
+            # orjson encodes the dataclass directly to UTF-8 bytes
+            jsonl_file.write(orjson.dumps(block) + b"\n")
+            txt_file.write(_txt_record(total, block))
 
+            urls.add(block.source_url)
+            type_counts[block.content_type] = type_counts.get(block.content_type, 0) + 1
+            if block.section_title is None:
+                null_sections += 1
+
+    print(f"\n✅ JSONL saved : {jsonl_path.resolve()}")
+    print(f"✅ TXT saved   : {txt_path.resolve()}")
+
+    # Summary stats
     print(f"\n📊 Scraping Summary:")
     print(f"   Pages crawled       : {len(urls)}")
-    print(f"   Total blocks        : {len(blocks)}")
+    print(f"   Total blocks        : {total}")
     print(f"   Content types       : {type_counts}")
-    print(f"   Blocks with section : {len(blocks) - null_sections} "
-          f"({(len(blocks) - null_sections) / max(len(blocks), 1) * 100:.1f}%)")
+    print(f"   Blocks with section : {total - null_sections} "
+          f"({(total - null_sections) / max(total, 1) * 100:.1f}%)")
     print(f"   Blocks without      : {null_sections} "
-          f"({null_sections / max(len(blocks), 1) * 100:.1f}%)")
+          f"({null_sections / max(total, 1) * 100:.1f}%)")
     print(f"\n➡️  Next step: run chunker.py on scraped.jsonl")
 
 
@@ -393,18 +603,20 @@ def main():
     delay = float(
         input("Delay between requests in seconds (default: 1.0): ").strip() or "1.0"
     )
+    concurrency = int(input("Parallel requests (default: 10): ").strip() or "10")
 
     extractor = GovernanceContentExtractor(
         max_depth=max_depth,
         document_type=doc_type,
         delay=delay,
+        concurrency=concurrency,
     )
 
     print(f"\n🚀 Starting crawl from: {url}\n")
-    blocks = extractor.crawl(url)
-
-    print(f"\n✅ Total blocks extracted: {len(blocks)}")
-    save_outputs(blocks)
+    try:
+        save_outputs(extractor.crawl(url))
+    finally:
+        extractor.close()
 
 
 if __name__ == "__main__":